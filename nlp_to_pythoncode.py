@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 # ============================================================================
 # SIMPLE NATURAL LANGUAGE TO PYTHON CODE GENERATOR
@@ -10,191 +11,13 @@ import re
 # 4. Returns the generated Python code
 # ============================================================================
 
-def generate_python_code(instruction: str) -> str:
-    """
-    Convert simple English instructions to Python code.
-    
-    RULE FORMAT:
-    (pattern, transformation_function)
-    
-    pattern: Regex pattern to match the instruction
-    transformation_function: Converts matched groups to Python code
-    
-    The FIRST matching pattern is used.
-    """
-    
-    # Convert to lowercase and remove extra spaces
-    instruction = instruction.lower().strip()
-    
-    # If empty instruction
-    if not instruction:
-        return "# Please enter an instruction"
-    
-    # ========================================================================
-    # DEFINE ALL PATTERNS AND THEIR TRANSFORMATIONS
-    # ========================================================================
-    # Order matters! First match wins.
-    
-    rules = [
-        # --------------------------------------------------------------------
-        # PATTERN 1: Print plain text
-        # --------------------------------------------------------------------
-        # Matches: "print hello" or "print good morning"
-        # Groups: The text after "print"
-        (
-            r"print (.+)",  # Pattern
-            lambda m: 'print("{}")'.format(m.group(1))  # Transformation
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 2: Print numbers in range
-        # --------------------------------------------------------------------
-        # Matches: "print numbers from 1 to 10"
-        # Groups: start number (1), end number (10)
-        (
-            r"print numbers from (\d+) to (\d+)",
-            lambda m: "for i in range({}, {}):\n    print(i)".format(
-                int(m.group(1)),  # Start
-                int(m.group(2)) + 1  # End + 1 (to include last number)
-            )
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 3: Basic math operations
-        # --------------------------------------------------------------------
-        # Matches: "add 5 and 3" or "multiply 4 and 6"
-        # Groups: operation, first number, second number
-        (
-            r"(add|subtract|multiply|divide) (\d+) and (\d+)",
-            lambda m: "print({} {} {})".format(
-                m.group(2),  # First number
-                {  # Convert word to operator symbol
-                    "add": "+",
-                    "subtract": "-", 
-                    "multiply": "*",
-                    "divide": "/"
-                }[m.group(1)],  # Operation symbol
-                m.group(3)  # Second number
-            )
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 4: Create a list
-        # --------------------------------------------------------------------
-        # Matches: "create list 1,2,3" or "create list apple,banana"
-        # Groups: Comma-separated values
-        (
-            r"create list (.+)",
-            lambda m: "my_list = [{}]".format(
-                ", ".join(
-                    # Add quotes if value is not a number
-                    '"{}"'.format(val.strip()) if not val.strip().isdigit()
-                    else val.strip()
-                    for val in m.group(1).split(",")
-                )
-            )
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 5: Append to list
-        # --------------------------------------------------------------------
-        # Matches: "append 5 to list" or "append hello to list"
-        (
-            r"append (.+) to list",
-            lambda m: 'my_list.append("{}")'.format(m.group(1))
-            if not m.group(1).isdigit()
-            else "my_list.append({})".format(m.group(1))
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 6: Sort list
-        # --------------------------------------------------------------------
-        (r"sort list", lambda _: "my_list.sort()"),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 7: Print list
-        # --------------------------------------------------------------------
-        (r"print list", lambda _: "print(my_list)"),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 8: Square a number
-        # --------------------------------------------------------------------
-        (r"square (\d+)", lambda m: "print({} ** 2)".format(m.group(1))),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 9: Create a string
-        # --------------------------------------------------------------------
-        (
-            r"create string (.+)",
-            lambda m: 'my_string = "{}"'.format(m.group(1))
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 10: Convert string to uppercase
-        # --------------------------------------------------------------------
-        (r"uppercase string", lambda _: 'my_string = my_string.upper()'),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 11: Print string
-        # --------------------------------------------------------------------
-        (r"print string", lambda _: "print(my_string)"),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 12: Create a dictionary
-        # --------------------------------------------------------------------
-        # Matches: "create dictionary name:john, age:25"
-        # Groups: Comma-separated key:value pairs
-        (
-            r"create dictionary (.+)",
-            lambda m: "my_dict = {" + ", ".join(
-                # Format each key:value pair
-                '"{}": {}'.format(
-                    key.strip(),  # Key (always string with quotes)
-                    # Value: add quotes if not a number
-                    '"{}"'.format(val.strip()) if not val.strip().isdigit()
-                    else val.strip()
-                )
-                for pair in m.group(1).split(",")
-                for key, val in [pair.split(":")]
-            ) + "}"
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 13: Print dictionary
-        # --------------------------------------------------------------------
-        (r"print dictionary", lambda _: "print(my_dict)"),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 14: Simple if condition
-        # --------------------------------------------------------------------
-        # Matches: "if x equals 10 then print correct"
-        # Groups: variable, value, message
-        (
-            r"if (\w+) equals (\d+) then print (.+)",
-            lambda m: 'if {} == {}: print("{}")'.format(
-                m.group(1), m.group(2), m.group(3)
-            )
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 15: Loop through list
-        # --------------------------------------------------------------------
-        (r"loop list", lambda _: "for item in my_list:\n    print(item)"),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 16: Get user input
-        # --------------------------------------------------------------------
-        (
-            r"ask input (.+)",
-            lambda m: 'user_input = input("{}")'.format(m.group(1))
-        ),
-        
-        # --------------------------------------------------------------------
-        # PATTERN 17: Help command
-        # --------------------------------------------------------------------
-        (
-            r"help|show commands",
-            lambda _: '''# Available commands:
+# ============================================================================
+# FIXED COMMANDS
+# ============================================================================
+# Commands without any parameters are looked up in a plain dict, which is
+# much cheaper than running them through the regex engine.
+
+_HELP_TEXT = '''# Available commands:
 # print [text]  - Print any text
 # print numbers from X to Y - Print range of numbers
 # add/subtract/multiply/divide X and Y - Math operations
@@ -212,26 +35,301 @@ def generate_python_code(instruction: str) -> str:
 # loop list - Loop through list
 # ask input [message] - Get user input
 # help - Show this message'''
+
+_LITERAL_RULES = {
+    "sort list": "my_list.sort()",
+    "print list": "print(my_list)",
+    "print string": "print(my_string)",
+    "print dictionary": "print(my_dict)",
+    "loop list": "for item in my_list:\n    print(item)",
+    "uppercase string": "my_string = my_string.upper()",
+    "help": _HELP_TEXT,
+    "show commands": _HELP_TEXT,
+}
+
+# Anything longer cannot be a fixed command
+_LITERAL_MAX_LEN = max(map(len, _LITERAL_RULES))
+
+# Convert math word to operator symbol
+_OPS = {
+    "add": "+",
+    "subtract": "-",
+    "multiply": "*",
+    "divide": "/",
+}
+
+# ============================================================================
+# HELPERS FOR LONGER TRANSFORMATIONS
+# ============================================================================
+
+def _quote_if_str(value):
+    """Strip a value and add quotes unless it is a number."""
+    value = value.strip()
+    return value if value.isdigit() else f'"{value}"'
+
+
+def _make_list(values):
+    """Turn "1,2,apple" into a my_list = [...] assignment."""
+    # Each value is stripped once; quotes are added if it is not a number
+    items = ", ".join(map(_quote_if_str, values.split(",")))
+    return f"my_list = [{items}]"
+
+
+def _make_dict(pairs):
+    """Turn "name:john, age:25" into a my_dict = {...} assignment."""
+    parts = []
+    for pair in pairs.split(","):
+        # partition() splits at the first ":" only and never raises
+        key, _, val = pair.partition(":")
+        # Key is always a string; value gets quotes if not a number
+        parts.append(f'"{key.strip()}": {_quote_if_str(val)}')
+    return "my_dict = {" + ", ".join(parts) + "}"
+
+
+def _print_range(text):
+    """Turn "from 1 to 10" into a loop printing 1..10, or None."""
+    # str.isdecimal() accepts exactly what the regex \d did
+    parts = text.split(" ", 4)
+    if (
+        len(parts) == 4
+        and parts[0].lower() == "from"
+        and parts[2].lower() == "to"
+        and parts[1].isdecimal()
+        and parts[3].isdecimal()
+    ):
+        start = int(parts[1])
+        end = int(parts[3]) + 1  # End + 1 (to include last number)
+        return f"for i in range({start}, {end}):\n    print(i)"
+    return None
+
+
+def _regex_rule(pattern, transformation):
+    """
+    Wrap a regex for commands with several parameters.
+
+    The pattern is compiled once and matched against the text after the
+    command's keywords; the transformation receives the groups as a tuple.
+    """
+    pattern = re.compile(pattern, re.IGNORECASE)
+
+    def rule(text):
+        match = pattern.fullmatch(text)
+        return transformation(match.groups()) if match else None
+
+    return rule
+
+
+def _math_rule(symbol):
+    """Rule for "add 5 and 3" style commands using the given operator."""
+    return _regex_rule(
+        r"(\d+) and (\d+)",
+        lambda g: f"print({g[0]} {symbol} {g[1]})"
+    )
+
+
+# ============================================================================
+# DEFINE ALL COMMANDS AND THEIR TRANSFORMATIONS
+# ============================================================================
+# Commands are found by walking a small trie of keywords instead of trying
+# regex patterns one after another:
+#
+#   _COMMANDS[first word][second word] -> transformation of the text after
+#                                         the second word
+#   _COMMANDS[first word][None]        -> transformation of the text after
+#                                         the first word (fallback)
+#
+# Keywords are compared case-insensitively; the text passed on keeps the
+# case the user typed. A transformation may return None when the text does
+# not fit, e.g. "print numbers hello" falls back to printing the text.
+
+_COMMANDS = {
+    "print": {
+        # --------------------------------------------------------------------
+        # COMMAND 1: Print numbers in range
+        # --------------------------------------------------------------------
+        # Matches: "print numbers from 1 to 10"
+        "numbers": _print_range,
+
+        # --------------------------------------------------------------------
+        # COMMAND 2: Print plain text
+        # --------------------------------------------------------------------
+        # Matches: "print hello" or "print good morning"
+        None: lambda text: f'print("{text}")',
+    },
+
+    # ------------------------------------------------------------------------
+    # COMMAND 3: Basic math operations
+    # ------------------------------------------------------------------------
+    # Matches: "add 5 and 3" or "multiply 4 and 6"
+    # Groups: first number, second number
+    **{word: {None: _math_rule(symbol)} for word, symbol in _OPS.items()},
+
+    "create": {
+        # --------------------------------------------------------------------
+        # COMMAND 4: Create a list
+        # --------------------------------------------------------------------
+        # Matches: "create list 1,2,3" or "create list apple,banana"
+        "list": _make_list,
+
+        # --------------------------------------------------------------------
+        # COMMAND 5: Create a string
+        # --------------------------------------------------------------------
+        "string": lambda text: f'my_string = "{text}"',
+
+        # --------------------------------------------------------------------
+        # COMMAND 6: Create a dictionary
+        # --------------------------------------------------------------------
+        # Matches: "create dictionary name:john, age:25"
+        "dictionary": _make_dict,
+    },
+
+    # ------------------------------------------------------------------------
+    # COMMAND 7: Append to list
+    # ------------------------------------------------------------------------
+    # Matches: "append 5 to list" or "append hello to list"
+    "append": {
+        None: _regex_rule(
+            r"(.+) to list",
+            lambda g: f"my_list.append({_quote_if_str(g[0])})"
         ),
-    ]
-    
+    },
+
+    # ------------------------------------------------------------------------
+    # COMMAND 8: Square a number
+    # ------------------------------------------------------------------------
+    "square": {
+        None: lambda text: f"print({text} ** 2)" if text.isdecimal() else None,
+    },
+
+    # ------------------------------------------------------------------------
+    # COMMAND 9: Simple if condition
+    # ------------------------------------------------------------------------
+    # Matches: "if x equals 10 then print correct"
+    # Groups: variable, value, message
+    "if": {
+        None: _regex_rule(
+            r"(\w+) equals (\d+) then print (.+)",
+            lambda g: f'if {g[0]} == {g[1]}: print("{g[2]}")'
+        ),
+    },
+
+    # ------------------------------------------------------------------------
+    # COMMAND 10: Get user input
+    # ------------------------------------------------------------------------
+    "ask": {
+        "input": lambda text: f'user_input = input("{text}")',
+    },
+}
+
+# Every known first word, for rejecting unknown input with one startswith()
+_VALID_PREFIXES = tuple(sorted(
+    {*_COMMANDS, *(command.partition(" ")[0] for command in _LITERAL_RULES)}
+))
+
+# Only this many leading characters are needed for the startswith() check
+_PREFIX_MAX_LEN = max(map(len, _VALID_PREFIXES))
+
+_NOT_UNDERSTOOD = "# I don't understand. Type 'help' for available commands."
+
+
+@lru_cache(maxsize=128)
+def _classify(first_word):
+    """
+    Return the _COMMANDS node for a first word in any case, or None.
+
+    Cached because only a handful of distinct first words (in a few
+    spellings such as "print" / "Print") occur in practice, so most calls
+    skip lowercasing the word.
+    """
+    return _COMMANDS.get(first_word.lower())
+
+
+@lru_cache(maxsize=512)
+def generate_python_code(instruction: str) -> str:
+    """
+    Convert simple English instructions to Python code.
+
+    The function is pure, so results are cached per raw instruction:
+    repeated instructions skip matching entirely.
+
+    The instruction is stripped here; see generate_python_code_raw for
+    how it is matched.
+    """
+
+    # Remove extra spaces (keywords are matched case-insensitively)
+    instruction = instruction.strip()
+
+    # If empty instruction
+    if not instruction:
+        return "# Please enter an instruction"
+
+    return generate_python_code_raw(instruction)
+
+
+def generate_python_code_raw(instruction: str) -> str:
+    """
+    Convert an already stripped, non-empty instruction to Python code.
+
+    Skips all preprocessing and caching, for batch pipelines that
+    normalize their input themselves.
+
+    Fixed commands are answered straight from _LITERAL_RULES. Everything
+    else is looked up in the _COMMANDS keyword trie:
+
+    1. The first word selects a node, e.g. "create"
+    2. The second word selects a transformation in that node, e.g. "list",
+       which gets the rest of the instruction
+    3. If there is none, or it returns None, the node's None entry (if any)
+       gets everything after the first word instead
+    """
+
+    # Reject unknown commands before any other work. Lowercasing just the
+    # first few characters keeps this cheap for long instructions.
+    if not instruction[:_PREFIX_MAX_LEN].lower().startswith(_VALID_PREFIXES):
+        return _NOT_UNDERSTOOD
+
+    # Fixed commands first (e.g. "print list" before "print (.+)").
+    # Only instructions short enough to be one are lowercased for the lookup.
+    if len(instruction) <= _LITERAL_MAX_LEN:
+        literal = _LITERAL_RULES.get(instruction.lower())
+        if literal is not None:
+            return literal
+
     # ========================================================================
-    # MATCH INSTRUCTION AGAINST RULES
+    # WALK THE COMMAND TRIE
     # ========================================================================
-    
-    for pattern, action in rules:
-        # Try to match the instruction with current pattern
-        match = re.fullmatch(pattern, instruction)
-        
-        if match:
-            # If match found, execute the transformation function
-            return action(match)
-    
+
+    first, _, rest = instruction.partition(" ")
+    node = _classify(first)
+
+    # No command spans several lines
+    if node is not None and "\n" not in rest:
+        keyword, _, text = rest.partition(" ")
+        transformation = node.get(keyword.lower())
+        code = transformation(text) if transformation and text else None
+
+        if code is None and rest and None in node:
+            code = node[None](rest)
+
+        if code is not None:
+            return code
+
     # ========================================================================
     # NO MATCH FOUND
     # ========================================================================
-    
-    return "# I don't understand. Type 'help' for available commands."
+
+    return _NOT_UNDERSTOOD
+
+
+def generate_python_code_batch(instructions):
+    """
+    Convert many instructions at once, e.g. for preprocessing a dataset.
+
+    Returns a list with one generated snippet per instruction, in order.
+    Iteration happens inside map(), so there is no Python-level loop, and
+    repeated instructions are served from generate_python_code's cache.
+    """
+    return list(map(generate_python_code, instructions))
 
 
 # ============================================================================